@@ -4,12 +4,65 @@ Web-based dashboard for monitoring compliance status
 """
 
 from flask import Flask, render_template, jsonify, request
-import json
+from flask.json.provider import JSONProvider
+from flask_caching import Cache
+import orjson
 import datetime
+import functools
+import uuid
 from main import GovernanceManager, ComplianceStatus, RiskLevel
 
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson for faster API responses"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj), mimetype='application/json')
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+cache = Cache(app, config={'CACHE_TYPE': 'SimpleCache'})
 gov_manager = GovernanceManager()
+_controls_json = (None, None)  # (gov_manager.version, serialized /api/controls body)
+_BOOT_ID = uuid.uuid4().hex  # The version counter restarts with the process, so ETags carry this too
+
+# Risk scoring weights used by /api/compliance-trends
+_BASE_RISK = {
+    RiskLevel.LOW: 1,
+    RiskLevel.MEDIUM: 2,
+    RiskLevel.HIGH: 3,
+    RiskLevel.CRITICAL: 4
+}
+_STATUS_MULTIPLIER = {
+    ComplianceStatus.COMPLIANT: 0.1,
+    ComplianceStatus.IN_PROGRESS: 0.5,
+    ComplianceStatus.NON_COMPLIANT: 1.0,
+    ComplianceStatus.NOT_ASSESSED: 0.8
+}
+
+def _versioned_cache_key():
+    """Cache key that changes whenever governance state does"""
+    return f"view/{request.path}/{gov_manager.version}"
+
+def conditional(view):
+    """Tag responses with the state version and answer 304 while it is unchanged"""
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        etag = f"{_BOOT_ID}-{gov_manager.version}"
+        if etag in request.if_none_match:
+            response = app.response_class(status=304)
+        else:
+            response = app.make_response(view(*args, **kwargs))
+        response.set_etag(etag)
+        response.cache_control.no_cache = True
+        return response
+    return wrapper
 
 @app.route('/')
 def dashboard():
@@ -17,31 +70,40 @@ def dashboard():
     return render_template('dashboard.html')
 
 @app.route('/api/compliance-summary')
+@conditional
+@cache.cached(timeout=5, key_prefix=_versioned_cache_key)
 def get_compliance_summary():
     """API endpoint for compliance summary"""
     summary = gov_manager.get_compliance_summary()
     return jsonify(summary)
 
 @app.route('/api/controls')
+@conditional
 def get_all_controls():
     """API endpoint for all controls"""
-    all_controls = gov_manager.iso27001_controls + gov_manager.pci_dss_controls
-    controls_dict = []
+    global _controls_json
+    version = gov_manager.version
+    cached_version, body = _controls_json
     
-    for control in all_controls:
-        control_dict = {
-            'control_id': control.control_id,
-            'title': control.title,
-            'description': control.description,
-            'standard': control.standard,
-            'status': control.status.value,
-            'risk_level': control.risk_level.value,
-            'responsible_team': control.responsible_team,
-            'notes': control.notes
-        }
-        controls_dict.append(control_dict)
+    # Serialize only when the controls have changed since the last request
+    if cached_version != version:
+        controls_dict = []
+        for control in gov_manager.all_controls:
+            control_dict = {
+                'control_id': control.control_id,
+                'title': control.title,
+                'description': control.description,
+                'standard': control.standard,
+                'status': control.status,
+                'risk_level': control.risk_level,
+                'responsible_team': control.responsible_team,
+                'notes': control.notes
+            }
+            controls_dict.append(control_dict)
+        body = orjson.dumps(controls_dict)
+        _controls_json = (version, body)
     
-    return jsonify(controls_dict)
+    return app.response_class(body, mimetype='application/json')
 
 @app.route('/api/update-control', methods=['POST'])
 def update_control():
@@ -56,37 +118,14 @@ def update_control():
     return jsonify({'success': success})
 
 @app.route('/api/risk-assessment')
+@conditional
+@cache.cached(timeout=5, key_prefix=_versioned_cache_key)
 def get_risk_assessment():
     """API endpoint for risk assessment data"""
-    all_controls = gov_manager.iso27001_controls + gov_manager.pci_dss_controls
-    
-    risk_data = {
-        'critical': 0,
-        'high': 0,
-        'medium': 0,
-        'low': 0
-    }
-    
-    non_compliant_by_risk = {
-        'critical': 0,
-        'high': 0,
-        'medium': 0,
-        'low': 0
-    }
-    
-    for control in all_controls:
-        risk_level = control.risk_level.value
-        risk_data[risk_level] += 1
-        
-        if control.status == ComplianceStatus.NON_COMPLIANT:
-            non_compliant_by_risk[risk_level] += 1
-    
-    return jsonify({
-        'total_by_risk': risk_data,
-        'non_compliant_by_risk': non_compliant_by_risk
-    })
+    return jsonify(gov_manager.get_risk_assessment())
 
 @app.route('/api/alerts')
+@conditional
 def get_alerts():
     """API endpoint for active alerts"""
     return jsonify(gov_manager.get_active_alerts())
@@ -101,6 +140,7 @@ def acknowledge_alert():
     return jsonify({'success': success})
 
 @app.route('/api/incidents')
+@conditional
 def get_recent_incidents():
     """API endpoint for recent incidents"""
     recent_incidents = [
@@ -108,28 +148,25 @@ def get_recent_incidents():
             "incident_id": inc.incident_id,
             "title": inc.title,
             "description": inc.description,
-            "severity": inc.severity.value,
-            "occurrence_time": inc.occurrence_time.isoformat(),
+            "severity": inc.severity,
+            "occurrence_time": inc.occurrence_time,
             "affected_controls": inc.affected_controls,
             "resolved": inc.resolution_time is not None
         }
-        for inc in gov_manager.incidents[-20:]  # Last 20 incidents
+        for inc in list(gov_manager.recent_incidents)  # Snapshot; the monitor thread may append
     ]
     return jsonify(recent_incidents)
 
 @app.route('/api/trigger-simulation', methods=['POST'])
 def trigger_simulation():
     """Manually trigger compliance simulation for demo"""
-    gov_manager._check_compliance_drift()
-    gov_manager._simulate_incidents()
-    gov_manager._check_overdue_reviews()
+    # The monitoring thread runs the cycle; clients pick up the results on their next poll
+    gov_manager.request_monitoring_cycle()
     
     return jsonify({
         'success': True,
-        'message': 'Simulation triggered',
-        'active_alerts': len(gov_manager.get_active_alerts()),
-        'total_incidents': len(gov_manager.incidents)
-    })
+        'message': 'Simulation scheduled'
+    }), 202
 
 @app.route('/api/force-incident', methods=['POST'])
 def force_incident():
@@ -141,10 +178,10 @@ def force_incident():
         'incident': {
             'incident_id': incident.incident_id,
             'title': incident.title,
-            'severity': incident.severity.value,
+            'severity': incident.severity,
             'affected_controls': incident.affected_controls
         },
-        'active_alerts': len(gov_manager.get_active_alerts())
+        'active_alerts': gov_manager.active_alert_count
     })
 
 @app.route('/api/resolve-incident', methods=['POST'])
@@ -167,61 +204,68 @@ def implement_solution():
     return jsonify({'success': success})
 
 @app.route('/api/non-compliant-controls')
+@conditional
 def get_non_compliant_controls():
     """Get controls that need solutions"""
-    all_controls = gov_manager.iso27001_controls + gov_manager.pci_dss_controls
-    
     non_compliant = []
-    for control in all_controls:
-        if control.status in [ComplianceStatus.NON_COMPLIANT, ComplianceStatus.IN_PROGRESS]:
-            non_compliant.append({
-                'control_id': control.control_id,
-                'title': control.title,
-                'status': control.status.value,
-                'risk_level': control.risk_level.value,
-                'automation_level': control.automation_level,
-                'incident_count': control.incident_count
-            })
+    for control in gov_manager.get_controls_needing_solution():
+        non_compliant.append({
+            'control_id': control.control_id,
+            'title': control.title,
+            'status': control.status,
+            'risk_level': control.risk_level,
+            'automation_level': control.automation_level,
+            'incident_count': control.incident_count
+        })
     
     return jsonify(non_compliant)
 
 @app.route('/api/compliance-trends')
+@conditional
+@cache.cached(timeout=5, key_prefix=_versioned_cache_key)
 def get_compliance_trends():
     """API endpoint for compliance trends over time"""
-    all_controls = gov_manager.iso27001_controls + gov_manager.pci_dss_controls
-    
-    # Calculate dynamic risk scores
-    total_risk_score = 0
-    automation_coverage = 0
-    drift_risk = 0
+    return jsonify(_compliance_trends())
+
+@app.route('/api/dashboard-state')
+@conditional
+@cache.cached(timeout=5, key_prefix=_versioned_cache_key)
+def get_dashboard_state():
+    """Summary, risk assessment, trends and alerts in one response for dashboard refreshes"""
+    return jsonify({
+        'summary': gov_manager.get_compliance_summary(),
+        'risk_assessment': gov_manager.get_risk_assessment(),
+        'trends': _compliance_trends(),
+        'alerts': gov_manager.get_active_alerts()
+    })
+
+def _compliance_trends():
+    """Calculate risk score, automation coverage and drift risk across all controls"""
+    all_controls = gov_manager.all_controls
     
-    for control in all_controls:
-        # Risk scoring based on multiple factors
-        base_risk = {'low': 1, 'medium': 2, 'high': 3, 'critical': 4}[control.risk_level.value]
-        status_multiplier = {
-            'compliant': 0.1,
-            'in_progress': 0.5,
-            'non_compliant': 1.0,
-            'not_assessed': 0.8
-        }[control.status.value]
-        
-        incident_factor = min(control.incident_count * 0.2, 1.0)
-        control_risk = base_risk * status_multiplier * (1 + incident_factor)
-        total_risk_score += control_risk
-        
-        automation_coverage += control.automation_level
-        drift_risk += control.compliance_drift_factor * (1 - control.automation_level)
+    # Calculate dynamic risk scores based on multiple factors
+    total_risk_score = sum(
+        _BASE_RISK[control.risk_level]
+        * _STATUS_MULTIPLIER[control.status]
+        * (1 + min(control.incident_count * 0.2, 1.0))
+        for control in all_controls
+    )
+    automation_coverage = sum(control.automation_level for control in all_controls)
+    drift_risk = sum(
+        control.compliance_drift_factor * (1 - control.automation_level)
+        for control in all_controls
+    )
     
     avg_automation = automation_coverage / len(all_controls) if all_controls else 0
     avg_drift_risk = drift_risk / len(all_controls) if all_controls else 0
     
-    return jsonify({
+    return {
         'total_risk_score': round(total_risk_score, 2),
         'average_automation': round(avg_automation * 100, 1),
         'drift_risk_factor': round(avg_drift_risk * 100, 1),
-        'total_incidents': len(gov_manager.incidents),
-        'active_alerts': len(gov_manager.get_active_alerts())
-    })
+        'total_incidents': gov_manager.total_incidents,
+        'active_alerts': gov_manager.active_alert_count
+    }
 
 if __name__ == '__main__':
-    app.run(debug=True, port=5000)
+    app.run(debug=True, port=5000, threaded=True)
@@ -6,16 +6,23 @@ This system helps governance teams manage and monitor compliance
 with ISO 27001 and PCI DSS standards.
 """
 
-import json
+import orjson
 import datetime
 import random
 import time
 import threading
 import logging
-from typing import Dict, List, Any, Optional
+import logging.handlers
+import queue
+import atexit
+import functools
+from collections import Counter, deque
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, asdict, field
 from enum import Enum
 
+logger = logging.getLogger(__name__)
+
 class ComplianceStatus(Enum):
     COMPLIANT = "compliant"
     NON_COMPLIANT = "non_compliant"
@@ -28,7 +35,26 @@ class RiskLevel(Enum):
     HIGH = "high"
     CRITICAL = "critical"
 
-@dataclass
+# Statuses that call for remediation, and risk levels reported as high risk
+_NEEDS_SOLUTION = frozenset({ComplianceStatus.NON_COMPLIANT, ComplianceStatus.IN_PROGRESS})
+_HIGH_RISK = frozenset({RiskLevel.HIGH, RiskLevel.CRITICAL})
+
+# Most audit log entries, alerts and incidents kept in memory
+_HISTORY_LIMIT = 10_000
+
+# Incident templates: (id prefix, title, affected controls, severity)
+_INCIDENT_TYPES: Tuple[Tuple[str, str, Tuple[str, ...], RiskLevel], ...] = (
+    ("SEC-001", "Failed Password Audit", ("PCI.2.1",), RiskLevel.HIGH),
+    ("SEC-002", "Firewall Misconfiguration", ("PCI.1.1",), RiskLevel.CRITICAL),
+    ("SEC-003", "Asset Discovery Gap", ("A.8.1.1",), RiskLevel.MEDIUM),
+    ("SEC-004", "Policy Violation", ("A.5.1.1",), RiskLevel.HIGH),
+    ("SEC-005", "Unauthorized Access Detected", ("A.6.1.1",), RiskLevel.CRITICAL),
+    ("SEC-006", "Encryption Key Exposure", ("PCI.3.4",), RiskLevel.CRITICAL)
+)
+# The background simulation only draws from the first four
+_SIMULATED_INCIDENT_TYPES = _INCIDENT_TYPES[:4]
+
+@dataclass(slots=True)
 class ControlRequirement:
     control_id: str
     title: str
@@ -46,39 +72,88 @@ class ControlRequirement:
     incident_count: int = 0
     automation_level: float = 0.0  # 0.0 = manual, 1.0 = fully automated
     dependency_controls: List[str] = field(default_factory=list)
+    review_due_date: Optional[datetime.datetime] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Parse the review date once; the monitoring loop compares it every tick
+        if not self.next_review_date:
+            return
+        try:
+            self.review_due_date = datetime.datetime.strptime(self.next_review_date, "%Y-%m-%d")
+        except ValueError:
+            self.review_due_date = None
 
-@dataclass
+@dataclass(slots=True)
 class ComplianceIncident:
     incident_id: str
     title: str
     description: str
-    affected_controls: List[str]
+    affected_controls: Tuple[str, ...]
     severity: RiskLevel
     occurrence_time: datetime.datetime
     resolution_time: Optional[datetime.datetime] = None
     impact_duration_hours: int = 24
 
+def _synchronized(method):
+    """Run a GovernanceManager method while holding the manager's write lock"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
 class GovernanceManager:
     def __init__(self):
+        self._lock = threading.RLock()  # Serializes writers; readers use snapshots
         self.iso27001_controls = self._load_iso27001_controls()
         self.pci_dss_controls = self._load_pci_dss_controls()
-        self.audit_log = []
-        self.incidents = []
-        self.alerts = []
+        self._all_controls = tuple(self.iso27001_controls + self.pci_dss_controls)
+        self.version = 0  # Bumped on every state change
+        self._total_by_risk = {level: 0 for level in ("critical", "high", "medium", "low")}
+        self._non_compliant_by_risk = dict(self._total_by_risk)
+        self._controls_by_id = {}
+        self._status_counts = {}  # catalog standard -> Counter of control statuses
+        self._needs_solution = {}  # control_id -> control, for non-compliant/in-progress controls
+        for control in self.all_controls:
+            self._index_control(control)
+        self.audit_log = deque(maxlen=_HISTORY_LIMIT)
+        self.incidents = deque(maxlen=_HISTORY_LIMIT)
+        self.recent_incidents = deque(maxlen=20)  # Hot view for the dashboard feed
+        self.total_incidents = 0
+        self.alerts = deque(maxlen=_HISTORY_LIMIT)
+        self._alert_seq = 0
+        self._alerts_by_id = {}
+        self._active_alerts = {}  # alert id -> alert, unacknowledged only, in creation order
         self.monitoring_active = True
+        self._monitor_wakeup = threading.Event()
         self._setup_logging()
         self._start_monitoring_thread()
     
     def _setup_logging(self):
-        """Setup logging for governance activities"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('governance.log'),
-                logging.StreamHandler()
-            ]
-        )
+        """Setup logging for governance activities
+        
+        Callers only enqueue records; a background listener writes them to the
+        log file and console so alert and incident bursts never wait on I/O.
+        """
+        root = logging.getLogger()
+        if root.handlers:
+            return  # Already configured
+        
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        handlers = [
+            logging.FileHandler('governance.log'),
+            logging.StreamHandler()
+        ]
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        
+        log_queue = queue.SimpleQueue()
+        root.addHandler(logging.handlers.QueueHandler(log_queue))
+        root.setLevel(logging.INFO)
+        
+        listener = logging.handlers.QueueListener(log_queue, *handlers)
+        listener.start()
+        atexit.register(listener.stop)
         
     def _load_iso27001_controls(self) -> List[ControlRequirement]:
         """Load ISO 27001 control requirements"""
@@ -183,35 +258,86 @@ class GovernanceManager:
         ]
         return controls
     
+    @property
+    def all_controls(self) -> Tuple[ControlRequirement, ...]:
+        """Snapshot of all ISO 27001 and PCI DSS controls, safe to iterate without locking"""
+        return self._all_controls
+    
+    @_synchronized
+    def add_control(self, control: ControlRequirement):
+        """Add a control to the catalog for its standard"""
+        if control.standard == "PCI_DSS":
+            self.pci_dss_controls.append(control)
+        else:
+            self.iso27001_controls.append(control)
+        self._all_controls = tuple(self.iso27001_controls + self.pci_dss_controls)
+        self._index_control(control)
+        self._bump_version()
+    
+    @staticmethod
+    def _catalog_of(control: ControlRequirement) -> str:
+        """Standard whose catalog holds the control; add_control files unknown standards under ISO 27001"""
+        return "PCI_DSS" if control.standard == "PCI_DSS" else "ISO27001"
+    
+    def _index_control(self, control: ControlRequirement):
+        """Account for a newly loaded control in the lookup index and maintained aggregates"""
+        self._controls_by_id[control.control_id] = control
+        self._status_counts.setdefault(self._catalog_of(control), Counter())[control.status] += 1
+        self._total_by_risk[control.risk_level.value] += 1
+        if control.status == ComplianceStatus.NON_COMPLIANT:
+            self._non_compliant_by_risk[control.risk_level.value] += 1
+        if control.status in _NEEDS_SOLUTION:
+            self._needs_solution[control.control_id] = control
+    
+    def _set_status(self, control: ControlRequirement, status: ComplianceStatus):
+        """Change a control's status, keeping the maintained aggregates in step"""
+        status_counts = self._status_counts[self._catalog_of(control)]
+        status_counts[control.status] -= 1
+        status_counts[status] += 1
+        if control.status == ComplianceStatus.NON_COMPLIANT:
+            self._non_compliant_by_risk[control.risk_level.value] -= 1
+        control.status = status
+        if status == ComplianceStatus.NON_COMPLIANT:
+            self._non_compliant_by_risk[control.risk_level.value] += 1
+        if status in _NEEDS_SOLUTION:
+            self._needs_solution[control.control_id] = control
+        else:
+            self._needs_solution.pop(control.control_id, None)
+        self._bump_version()
+    
+    def _bump_version(self):
+        """Record a state change so cached views can be rebuilt"""
+        self.version += 1
+    
+    @_synchronized
     def update_control_status(self, control_id: str, status: ComplianceStatus, notes: str = ""):
         """Update the compliance status of a control"""
-        all_controls = self.iso27001_controls + self.pci_dss_controls
+        control = self._controls_by_id.get(control_id)
+        if control is None:
+            print(f"Control {control_id} not found")
+            return False
         
-        for control in all_controls:
-            if control.control_id == control_id:
-                old_status = control.status
-                control.status = status
-                control.notes = notes
-                
-                # Log the change
-                self.audit_log.append({
-                    "timestamp": datetime.datetime.now().isoformat(),
-                    "action": "status_update",
-                    "control_id": control_id,
-                    "old_status": old_status.value,
-                    "new_status": status.value,
-                    "notes": notes
-                })
-                
-                print(f"Updated {control_id}: {old_status.value} -> {status.value}")
-                return True
+        old_status = control.status
+        self._set_status(control, status)
+        control.notes = notes
         
-        print(f"Control {control_id} not found")
-        return False
+        # Log the change
+        self.audit_log.append({
+            "timestamp": datetime.datetime.now().isoformat(),
+            "action": "status_update",
+            "control_id": control_id,
+            "old_status": old_status.value,
+            "new_status": status.value,
+            "notes": notes
+        })
+        self._bump_version()
+        
+        print(f"Updated {control_id}: {old_status.value} -> {status.value}")
+        return True
     
     def get_compliance_summary(self) -> Dict[str, Any]:
         """Generate compliance summary report"""
-        all_controls = self.iso27001_controls + self.pci_dss_controls
+        all_controls = self.all_controls
         
         iso_summary = self._get_standard_summary(self.iso27001_controls, "ISO27001")
         pci_summary = self._get_standard_summary(self.pci_dss_controls, "PCI_DSS")
@@ -227,10 +353,11 @@ class GovernanceManager:
     def _get_standard_summary(self, controls: List[ControlRequirement], standard: str) -> Dict[str, Any]:
         """Get summary for a specific standard"""
         total = len(controls)
-        compliant = len([c for c in controls if c.status == ComplianceStatus.COMPLIANT])
-        non_compliant = len([c for c in controls if c.status == ComplianceStatus.NON_COMPLIANT])
-        in_progress = len([c for c in controls if c.status == ComplianceStatus.IN_PROGRESS])
-        not_assessed = len([c for c in controls if c.status == ComplianceStatus.NOT_ASSESSED])
+        status_counts = self._status_counts.get(standard, Counter())
+        compliant = status_counts[ComplianceStatus.COMPLIANT]
+        non_compliant = status_counts[ComplianceStatus.NON_COMPLIANT]
+        in_progress = status_counts[ComplianceStatus.IN_PROGRESS]
+        not_assessed = status_counts[ComplianceStatus.NOT_ASSESSED]
         
         compliance_percentage = (compliant / total * 100) if total > 0 else 0
         
@@ -246,12 +373,11 @@ class GovernanceManager:
     
     def _get_high_risk_issues(self) -> List[Dict[str, str]]:
         """Get high-risk non-compliant controls"""
-        all_controls = self.iso27001_controls + self.pci_dss_controls
-        
         high_risk_issues = []
-        for control in all_controls:
+        # Non-compliant controls are a subset of those needing a solution
+        for control in self.get_controls_needing_solution():
             if (control.status == ComplianceStatus.NON_COMPLIANT and 
-                control.risk_level in [RiskLevel.HIGH, RiskLevel.CRITICAL]):
+                control.risk_level in _HIGH_RISK):
                 high_risk_issues.append({
                     "control_id": control.control_id,
                     "title": control.title,
@@ -261,137 +387,180 @@ class GovernanceManager:
         
         return high_risk_issues
     
+    def get_controls_needing_solution(self) -> List[ControlRequirement]:
+        """Get non-compliant and in-progress controls without scanning the catalog"""
+        return list(self._needs_solution.values())
+    
+    def get_risk_assessment(self) -> Dict[str, Dict[str, int]]:
+        """Get control counts per risk level, overall and non-compliant"""
+        return {
+            "total_by_risk": dict(self._total_by_risk),
+            "non_compliant_by_risk": dict(self._non_compliant_by_risk)
+        }
+    
     def _start_monitoring_thread(self):
         """Start background monitoring thread for compliance drift"""
         def monitor():
             while self.monitoring_active:
                 try:
-                    self._check_compliance_drift()
-                    self._simulate_incidents()
-                    self._check_overdue_reviews()
-                    time.sleep(10)  # Check every 10 seconds for demo
+                    self._run_monitoring_cycle()
+                    delay = 10  # Check every 10 seconds for demo
                 except Exception as e:
-                    logging.error(f"Monitoring error: {e}")
-                    time.sleep(60)
+                    logger.error("Monitoring error: %s", e)
+                    delay = 60
+                # Sleep until the next tick, a requested cycle, or a stop request
+                self._monitor_wakeup.wait(delay)
+                self._monitor_wakeup.clear()
         
-        monitor_thread = threading.Thread(target=monitor, daemon=True)
-        monitor_thread.start()
-        logging.info("Compliance monitoring thread started")
+        self._monitor_thread = threading.Thread(target=monitor, daemon=True)
+        self._monitor_thread.start()
+        logger.info("Compliance monitoring thread started")
+    
+    def stop_monitoring(self, timeout: float = 5.0):
+        """Stop the monitoring thread and wait for its current cycle to finish"""
+        self.monitoring_active = False
+        self._monitor_wakeup.set()
+        self._monitor_thread.join(timeout)
+        logger.info("Compliance monitoring thread stopped")
     
-    def _check_compliance_drift(self):
+    @_synchronized
+    def _run_monitoring_cycle(self):
+        """Run one round of drift, incident and overdue review checks"""
+        now = datetime.datetime.now()  # One clock reading shared by the whole tick
+        self._check_compliance_drift(now)
+        self._simulate_incidents(now)
+        self._check_overdue_reviews(now)
+    
+    def request_monitoring_cycle(self):
+        """Wake the monitoring thread to run a cycle without waiting for the next tick"""
+        self._monitor_wakeup.set()
+    
+    def _check_compliance_drift(self, now: datetime.datetime):
         """Simulate compliance drift over time"""
-        all_controls = self.iso27001_controls + self.pci_dss_controls
+        all_controls = self.all_controls
         
         for control in all_controls:
             if control.status == ComplianceStatus.COMPLIANT and control.last_assessment_date:
-                days_since_assessment = (datetime.datetime.now() - control.last_assessment_date).days
+                days_since_assessment = (now - control.last_assessment_date).days
                 
                 # Calculate drift probability based on time and drift factor
                 drift_probability = control.compliance_drift_factor * (days_since_assessment / 30) * (1 - control.automation_level)
                 
                 if random.random() < drift_probability * 0.3:  # Higher chance for demo
                     old_status = control.status
-                    control.status = ComplianceStatus.IN_PROGRESS
+                    self._set_status(control, ComplianceStatus.IN_PROGRESS)
                     self._create_alert(
                         f"Compliance drift detected for {control.control_id}",
                         f"Control {control.control_id} has drifted from compliant status due to time decay",
-                        control.risk_level
+                        control.risk_level,
+                        now
                     )
-                    logging.warning(f"Compliance drift: {control.control_id} {old_status.value} -> {control.status.value}")
+                    logger.warning("Compliance drift: %s %s -> %s", control.control_id, old_status.value, control.status.value)
     
-    def _simulate_incidents(self):
+    def _simulate_incidents(self, now: datetime.datetime):
         """Simulate security incidents that affect compliance"""
         if random.random() < 0.15:  # 15% chance per check for demo
-            incident_types = [
-                ("SEC-001", "Failed Password Audit", ["PCI.2.1"], RiskLevel.HIGH),
-                ("SEC-002", "Firewall Misconfiguration", ["PCI.1.1"], RiskLevel.CRITICAL),
-                ("SEC-003", "Asset Discovery Gap", ["A.8.1.1"], RiskLevel.MEDIUM),
-                ("SEC-004", "Policy Violation", ["A.5.1.1"], RiskLevel.HIGH)
-            ]
-            
-            incident_id, title, affected_controls, severity = random.choice(incident_types)
+            incident_id, title, affected_controls, severity = random.choice(_SIMULATED_INCIDENT_TYPES)
             incident = ComplianceIncident(
-                incident_id=f"{incident_id}-{int(time.time())}",
+                incident_id=f"{incident_id}-{int(now.timestamp())}",
                 title=title,
                 description=f"Automated incident simulation: {title}",
                 affected_controls=affected_controls,
                 severity=severity,
-                occurrence_time=datetime.datetime.now()
+                occurrence_time=now
             )
             
-            self.incidents.append(incident)
-            self._apply_incident_impact(incident)
-            logging.warning(f"Incident simulated: {incident.title}")
+            self._record_incident(incident)
+            logger.warning("Incident simulated: %s", incident.title)
+    
+    def _record_incident(self, incident: ComplianceIncident):
+        """Store an incident and apply its impact to the affected controls"""
+        self.incidents.append(incident)
+        self.recent_incidents.append(incident)
+        self.total_incidents += 1
+        self._apply_incident_impact(incident)
     
     def _apply_incident_impact(self, incident: ComplianceIncident):
         """Apply incident impact to affected controls"""
-        all_controls = self.iso27001_controls + self.pci_dss_controls
-        
-        for control in all_controls:
-            if control.control_id in incident.affected_controls:
-                control.incident_count += 1
-                if control.status == ComplianceStatus.COMPLIANT:
-                    control.status = ComplianceStatus.NON_COMPLIANT
-                    self._create_alert(
-                        f"Incident impact: {control.control_id}",
-                        f"Control affected by incident: {incident.title}",
-                        incident.severity
-                    )
+        for control_id in incident.affected_controls:
+            control = self._controls_by_id.get(control_id)
+            if control is None:
+                continue
+            control.incident_count += 1
+            if control.status == ComplianceStatus.COMPLIANT:
+                self._set_status(control, ComplianceStatus.NON_COMPLIANT)
+                self._create_alert(
+                    f"Incident impact: {control.control_id}",
+                    f"Control affected by incident: {incident.title}",
+                    incident.severity,
+                    incident.occurrence_time
+                )
+        self._bump_version()
     
-    def _check_overdue_reviews(self):
+    def _check_overdue_reviews(self, now: datetime.datetime):
         """Check for overdue compliance reviews"""
-        all_controls = self.iso27001_controls + self.pci_dss_controls
+        all_controls = self.all_controls
         
         for control in all_controls:
-            if control.next_review_date:
-                try:
-                    review_date = datetime.datetime.strptime(control.next_review_date, "%Y-%m-%d")
-                    if datetime.datetime.now() > review_date:
-                        self._create_alert(
-                            f"Overdue review: {control.control_id}",
-                            f"Control {control.control_id} is past its review date",
-                            RiskLevel.MEDIUM
-                        )
-                except ValueError:
-                    pass
+            if control.review_due_date and now > control.review_due_date:
+                self._create_alert(
+                    f"Overdue review: {control.control_id}",
+                    f"Control {control.control_id} is past its review date",
+                    RiskLevel.MEDIUM,
+                    now
+                )
     
-    def _create_alert(self, title: str, message: str, severity: RiskLevel):
-        """Create governance alert"""
+    def _create_alert(self, title: str, message: str, severity: RiskLevel,
+                      now: Optional[datetime.datetime] = None):
+        """Create governance alert, stamped with the caller's clock reading if given"""
+        if now is None:
+            now = datetime.datetime.now()
         alert = {
-            "id": f"ALT-{int(time.time())}-{len(self.alerts)}",
+            "id": f"ALT-{int(now.timestamp())}-{self._alert_seq}",
             "title": title,
             "message": message,
             "severity": severity.value,
-            "timestamp": datetime.datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "acknowledged": False
         }
+        self._alert_seq += 1
+        if len(self.alerts) == self.alerts.maxlen:
+            # The oldest alert is about to fall off the history; drop it from the indexes too
+            evicted_id = self.alerts[0]["id"]
+            self._alerts_by_id.pop(evicted_id, None)
+            self._active_alerts.pop(evicted_id, None)
         self.alerts.append(alert)
-        logging.info(f"Alert created: {title}")
+        self._alerts_by_id[alert["id"]] = alert
+        self._active_alerts[alert["id"]] = alert
+        self._bump_version()
+        logger.info("Alert created: %s", title)
     
     def get_active_alerts(self) -> List[Dict]:
         """Get unacknowledged alerts"""
-        return [alert for alert in self.alerts if not alert["acknowledged"]]
+        return list(self._active_alerts.values())
     
+    @property
+    def active_alert_count(self) -> int:
+        """Number of unacknowledged alerts"""
+        return len(self._active_alerts)
+    
+    @_synchronized
     def acknowledge_alert(self, alert_id: str) -> bool:
         """Acknowledge an alert"""
-        for alert in self.alerts:
-            if alert["id"] == alert_id:
-                alert["acknowledged"] = True
-                return True
-        return False
+        alert = self._alerts_by_id.get(alert_id)
+        if alert is None:
+            return False
+        
+        if not alert["acknowledged"]:
+            alert["acknowledged"] = True
+            del self._active_alerts[alert_id]
+            self._bump_version()
+        return True
     
+    @_synchronized
     def force_incident(self, incident_type: str = None) -> ComplianceIncident:
         """Force create an incident for demo purposes"""
-        incident_types = [
-            ("SEC-001", "Failed Password Audit", ["PCI.2.1"], RiskLevel.HIGH),
-            ("SEC-002", "Firewall Misconfiguration", ["PCI.1.1"], RiskLevel.CRITICAL),
-            ("SEC-003", "Asset Discovery Gap", ["A.8.1.1"], RiskLevel.MEDIUM),
-            ("SEC-004", "Policy Violation", ["A.5.1.1"], RiskLevel.HIGH),
-            ("SEC-005", "Unauthorized Access Detected", ["A.6.1.1"], RiskLevel.CRITICAL),
-            ("SEC-006", "Encryption Key Exposure", ["PCI.3.4"], RiskLevel.CRITICAL)
-        ]
-        
-        incident_id, title, affected_controls, severity = random.choice(incident_types)
+        incident_id, title, affected_controls, severity = random.choice(_INCIDENT_TYPES)
         incident = ComplianceIncident(
             incident_id=f"{incident_id}-{int(time.time())}",
             title=title,
@@ -401,38 +570,37 @@ class GovernanceManager:
             occurrence_time=datetime.datetime.now()
         )
         
-        self.incidents.append(incident)
-        self._apply_incident_impact(incident)
-        logging.warning(f"FORCED incident: {incident.title}")
+        self._record_incident(incident)
+        logger.warning("FORCED incident: %s", incident.title)
         return incident
     
+    @_synchronized
     def resolve_incident(self, incident_id: str) -> bool:
         """Resolve an incident and restore affected controls"""
         for incident in self.incidents:
             if incident.incident_id == incident_id and not incident.resolution_time:
                 incident.resolution_time = datetime.datetime.now()
+                self._bump_version()
                 
                 # Restore affected controls to compliant status
-                all_controls = self.iso27001_controls + self.pci_dss_controls
-                for control in all_controls:
-                    if control.control_id in incident.affected_controls:
-                        if control.status == ComplianceStatus.NON_COMPLIANT:
-                            control.status = ComplianceStatus.COMPLIANT
-                            control.last_assessment_date = datetime.datetime.now()
-                            self._create_alert(
-                                f"Control restored: {control.control_id}",
-                                f"Control {control.control_id} restored to compliance after incident resolution",
-                                RiskLevel.LOW
-                            )
+                for control_id in incident.affected_controls:
+                    control = self._controls_by_id.get(control_id)
+                    if control is not None and control.status == ComplianceStatus.NON_COMPLIANT:
+                        self._set_status(control, ComplianceStatus.COMPLIANT)
+                        control.last_assessment_date = datetime.datetime.now()
+                        self._create_alert(
+                            f"Control restored: {control.control_id}",
+                            f"Control {control.control_id} restored to compliance after incident resolution",
+                            RiskLevel.LOW
+                        )
                 
-                logging.info(f"RESOLVED incident: {incident.title}")
+                logger.info("RESOLVED incident: %s", incident.title)
                 return True
         return False
     
+    @_synchronized
     def implement_solution(self, control_id: str, solution_type: str) -> bool:
         """Implement a solution for a non-compliant control"""
-        all_controls = self.iso27001_controls + self.pci_dss_controls
-        
         solutions = {
             "automation": "Automated monitoring and enforcement implemented",
             "training": "Staff training and awareness program completed",
@@ -441,42 +609,42 @@ class GovernanceManager:
             "process": "Improved security processes implemented"
         }
         
-        for control in all_controls:
-            if control.control_id == control_id:
-                if control.status in [ComplianceStatus.NON_COMPLIANT, ComplianceStatus.IN_PROGRESS]:
-                    control.status = ComplianceStatus.COMPLIANT
-                    control.last_assessment_date = datetime.datetime.now()
-                    
-                    # Improve control based on solution type
-                    if solution_type == "automation":
-                        control.automation_level = min(1.0, control.automation_level + 0.3)
-                        control.compliance_drift_factor *= 0.7  # Reduce drift
-                    elif solution_type == "training":
-                        control.compliance_drift_factor *= 0.8
-                    elif solution_type == "technology":
-                        control.automation_level = min(1.0, control.automation_level + 0.4)
-                        control.compliance_drift_factor *= 0.6
-                    
-                    solution_desc = solutions.get(solution_type, "Generic solution implemented")
-                    control.notes = f"Solution: {solution_desc}"
-                    
-                    self.audit_log.append({
-                        "timestamp": datetime.datetime.now().isoformat(),
-                        "action": "solution_implemented",
-                        "control_id": control_id,
-                        "solution_type": solution_type,
-                        "description": solution_desc
-                    })
-                    
-                    self._create_alert(
-                        f"Solution implemented: {control.control_id}",
-                        f"Control {control.control_id} restored via {solution_type}: {solution_desc}",
-                        RiskLevel.LOW
-                    )
-                    
-                    logging.info(f"SOLUTION implemented for {control_id}: {solution_type}")
-                    return True
-        return False
+        control = self._controls_by_id.get(control_id)
+        if control is None or control.status not in _NEEDS_SOLUTION:
+            return False
+        
+        self._set_status(control, ComplianceStatus.COMPLIANT)
+        control.last_assessment_date = datetime.datetime.now()
+        
+        # Improve control based on solution type
+        if solution_type == "automation":
+            control.automation_level = min(1.0, control.automation_level + 0.3)
+            control.compliance_drift_factor *= 0.7  # Reduce drift
+        elif solution_type == "training":
+            control.compliance_drift_factor *= 0.8
+        elif solution_type == "technology":
+            control.automation_level = min(1.0, control.automation_level + 0.4)
+            control.compliance_drift_factor *= 0.6
+        
+        solution_desc = solutions.get(solution_type, "Generic solution implemented")
+        control.notes = f"Solution: {solution_desc}"
+        
+        self.audit_log.append({
+            "timestamp": datetime.datetime.now().isoformat(),
+            "action": "solution_implemented",
+            "control_id": control_id,
+            "solution_type": solution_type,
+            "description": solution_desc
+        })
+        
+        self._create_alert(
+            f"Solution implemented: {control.control_id}",
+            f"Control {control.control_id} restored via {solution_type}: {solution_desc}",
+            RiskLevel.LOW
+        )
+        
+        logger.info("SOLUTION implemented for %s: %s", control_id, solution_type)
+        return True
     
     def export_report(self, filename: str = None):
         """Export compliance report to JSON"""
@@ -484,23 +652,24 @@ class GovernanceManager:
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"compliance_report_{timestamp}.json"
         
-        summary = self.get_compliance_summary()
-        summary["active_alerts"] = self.get_active_alerts()
-        summary["recent_incidents"] = [
-            {
-                "incident_id": inc.incident_id,
-                "title": inc.title,
-                "severity": inc.severity.value,
-                "occurrence_time": inc.occurrence_time.isoformat(),
-                "affected_controls": inc.affected_controls
-            }
-            for inc in self.incidents[-10:]  # Last 10 incidents
-        ]
-        
-        with open(filename, 'w') as f:
-            json.dump(summary, f, indent=2)
+        # Snapshot and serialize under the lock so the report is consistent,
+        # then release it before touching the filesystem
+        with self._lock:
+            summary = self.get_compliance_summary()
+            summary["active_alerts"] = self.get_active_alerts()
+            summary["recent_incidents"] = list(self.recent_incidents)[-10:]  # Last 10 incidents
+            
+            # orjson renders the incident dataclasses, enums and datetimes directly
+            payload = orjson.dumps(summary, option=orjson.OPT_INDENT_2)
         
+        self._write_report(filename, payload)
         print(f"Report exported to {filename}")
+    
+    @staticmethod
+    def _write_report(filename: str, payload: bytes):
+        """Write a serialized report to disk"""
+        with open(filename, 'wb') as f:
+            f.write(payload)
 
 def main():
     """Main function to demonstrate the governance system"""
@@ -533,6 +702,7 @@ def main():
     print("\nGenerating compliance report...")
     gov_manager.export_report()
     
+    gov_manager.stop_monitoring()
     print("\nGovernance system initialized successfully!")
 
 if __name__ == "__main__":